@@ -0,0 +1,78 @@
+# Backfill numeric wattage ranges and color temperatures used by the product filter endpoint
+# (one-off for existing rows; migrations/006_product_spec_triggers.sql applies the same parsing on later writes)
+
+import os
+import re
+from sqlalchemy import create_engine, select, update, insert, delete
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+from Models.models import Product, ProductColorTemp
+
+load_dotenv()
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Precompiled once so parsing stays a single C-level pass per row
+WATTAGE_RANGE_RE = re.compile(r"\s*(\d+)\s*W?\s*(?:-\s*(\d+)\s*W?\s*)?", re.IGNORECASE)
+COLOR_TEMP_STRIP = str.maketrans("", "", "Kk ")
+COLOR_TEMP_STEP = 100  # Tunable ranges ('2700K-6500K') are stored in 100K steps
+
+def parse_wattage_range(wattage_str: str):
+    """Extract min and max wattage from a range string like '3W-40W' (a single '40W' gives (40, 40))"""
+    match = WATTAGE_RANGE_RE.fullmatch(wattage_str) if wattage_str else None
+    if match is None:
+        return None, None
+    min_w = int(match[1])
+    return min_w, int(match[2]) if match[2] else min_w
+
+def parse_color_temp(color_temp_str: str):
+    """Extract individual color temperatures from a string like '4000K,5000K' or a tunable '2700K-6500K'"""
+    try:
+        temps = []
+        for temp in color_temp_str.translate(COLOR_TEMP_STRIP).split(","):
+            if not temp:
+                continue
+            low, _, high = temp.partition("-")
+            if high:
+                temps.extend(range(int(low), int(high), COLOR_TEMP_STEP))
+                temps.append(int(high))
+            else:
+                temps.append(int(low))
+        return temps
+    except (ValueError, AttributeError):
+        return []
+
+try:
+    engine = create_engine(DATABASE_URL)
+    with Session(engine) as session, session.begin():
+        products = session.execute(
+            select(Product.product_id, Product.product_wattage, Product.product_color_temp)
+        ).all()
+        wattage_rows = []
+        color_temp_rows = []
+        skipped = []
+        for product_id, wattage, color_temp in products:
+            min_w, max_w = parse_wattage_range(wattage)
+            kelvins = set(parse_color_temp(color_temp))
+            if wattage and min_w is None:
+                skipped.append(f"product {product_id}: wattage {wattage!r}")
+            if color_temp and not kelvins:
+                skipped.append(f"product {product_id}: color temperature {color_temp!r}")
+            wattage_rows.append({
+                "product_id": product_id,
+                "product_wattage_min": min_w,
+                "product_wattage_max": max_w
+            })
+            color_temp_rows.extend(
+                {"product_id": product_id, "kelvin": kelvin}
+                for kelvin in kelvins
+            )
+        if wattage_rows:
+            session.execute(update(Product), wattage_rows)
+        session.execute(delete(ProductColorTemp))
+        if color_temp_rows:
+            session.execute(insert(ProductColorTemp), color_temp_rows)
+    print(f"✅ Backfilled {len(products)} products")
+    for reason in skipped:
+        print(f"⚠️ Could not parse {reason} (not filterable until fixed)")
+except Exception as e:
+    print(f"❌ Backfill failed: {str(e)}")
\ No newline at end of file
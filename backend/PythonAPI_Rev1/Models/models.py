@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+import os
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, text, event, DDL
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 from database import Base
 
@@ -6,22 +8,42 @@ class Category(Base):
     __tablename__ = 'category'
     category_id = Column(Integer, primary_key=True, index=True)
     category_name = Column(String(50))
+    # Maintained by triggers on products / family (migrations/005_category_product_count.sql)
+    product_count = Column(Integer, nullable=False, server_default="0")
+    updated_at = Column(
+        mysql.TIMESTAMP(fsp=6),
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)")
+    )
     families = relationship("Family", back_populates="category_rel")
 
+    __table_args__ = (
+        Index('ix_category_name_fulltext', 'category_name', mysql_prefix='FULLTEXT'),
+    )
+
 class Family(Base):
     __tablename__ = 'family'
     family_id = Column(Integer, primary_key=True, index=True)
     family_name = Column(String(100))
-    category = Column(Integer, ForeignKey('category.category_id'))
+    category = Column(Integer, ForeignKey('category.category_id'), index=True)
     image = Column(String(50))
+    updated_at = Column(
+        mysql.TIMESTAMP(fsp=6),
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)")
+    )
     category_rel = relationship("Category", back_populates="families")
     products = relationship("Product", back_populates="family_rel")
 
+    __table_args__ = (
+        Index('ix_family_name_fulltext', 'family_name', mysql_prefix='FULLTEXT'),
+    )
+
 class Product(Base):
     __tablename__ = 'products'
     product_id = Column(Integer, primary_key=True, index=True)
     product_name = Column(String(50))
-    product_family = Column(Integer, ForeignKey('family.family_id'))
+    product_family = Column(Integer, ForeignKey('family.family_id'), index=True)
     product_color_temp = Column(String(100))
     product_optical_angle=Column(String(200))
     product_housing_color = Column(String(50))
@@ -41,9 +63,23 @@ class Product(Base):
     product_codes= Column(String(50))
     product_applications= Column(String(500))
     product_cri= Column(String(30))
+    # Numeric wattage range parsed from product_wattage (e.g. '3W-40W')
+    product_wattage_min = Column(Integer)
+    product_wattage_max = Column(Integer)
+    updated_at = Column(
+        mysql.TIMESTAMP(fsp=6),
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)")
+    )
     # Relations
     family_rel = relationship("Family", back_populates="products")
     wattages = relationship("ProductWattage", back_populates="product_rel")
+    color_temps = relationship("ProductColorTemp", back_populates="product_rel")
+
+    __table_args__ = (
+        Index('ix_products_wattage_range', 'product_wattage_min', 'product_wattage_max'),
+        Index('ix_products_name_fulltext', 'product_name', mysql_prefix='FULLTEXT'),
+    )
 
 class ProductWattage(Base):
     __tablename__ = 'product_wattage'
@@ -58,4 +94,44 @@ class ProductWattage(Base):
     product_voltage= Column(String(50))
     product_current= Column(String(50))
     # Relations
-    product_rel = relationship("Product", back_populates="wattages")
\ No newline at end of file
+    product_rel = relationship("Product", back_populates="wattages")
+
+class ProductColorTemp(Base):
+    __tablename__ = 'product_color_temps'
+    # One row per color temperature parsed from product_color_temp (e.g. '4000K,5000K')
+    product_id = Column(Integer, ForeignKey('products.product_id'), primary_key=True)
+    kelvin = Column(Integer, primary_key=True)
+    # Relations
+    product_rel = relationship("Product", back_populates="color_temps")
+
+    __table_args__ = (
+        Index('ix_product_color_temps_kelvin', 'kelvin', 'product_id'),
+    )
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+def read_migration_statements(filename: str):
+    """Split a migrations/*.sql file into single statements, honouring DELIMITER changes"""
+    statements, lines, delimiter = [], [], ";"
+    with open(os.path.join(MIGRATIONS_DIR, filename), encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.upper().startswith("DELIMITER "):
+                delimiter = stripped.split()[1]
+            elif stripped.endswith(delimiter):
+                lines.append(line.rstrip()[:-len(delimiter)])
+                statements.append("\n".join(lines).strip())
+                lines = []
+            elif stripped and not stripped.startswith("--"):
+                lines.append(line.rstrip())
+    return statements
+
+# Install the sync triggers on databases built by create_all (AUTO_CREATE_TABLES) once the tables they
+# touch exist; MySQL only. Columns added by the migrations already come from the models.
+for filename, table in (
+    ("005_category_product_count.sql", Product.__table__),
+    ("006_product_spec_triggers.sql", ProductColorTemp.__table__)
+):
+    for statement in read_migration_statements(filename):
+        if not statement.upper().startswith("ALTER TABLE"):
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect="mysql"))
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
 
 # API (1)
 class CategoryWithCountResponse(BaseModel):
@@ -6,13 +7,55 @@ class CategoryWithCountResponse(BaseModel):
     category_name: str
     product_count: int  # Changed field name
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+# API (3), (4), (5), (7)
+class ProductResponse(BaseModel):
+    product_id: int
+    product_name: Optional[str] = None
+    product_family: Optional[int] = None
+    product_color_temp: Optional[str] = None
+    product_optical_angle: Optional[str] = None
+    product_housing_color: Optional[str] = None
+    product_reflector_color: Optional[str] = None
+    product_control: Optional[str] = None
+    product_color_extended: Optional[str] = None
+    product_control_extended: Optional[str] = None
+    product_material: Optional[str] = None
+    product_mounting: Optional[str] = None
+    product_ip_rating: Optional[str] = None
+    product_lifetime: Optional[str] = None
+    product_sdcm: Optional[str] = None
+    product_wattage: Optional[str] = None
+    product_image: Optional[str] = None
+    product_technical_drawing: Optional[str] = None
+    product_light_distribution: Optional[str] = None
+    product_codes: Optional[str] = None
+    product_applications: Optional[str] = None
+    product_cri: Optional[str] = None
+    product_wattage_min: Optional[int] = None
+    product_wattage_max: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# API (4), (7)
+class ProductPageResponse(BaseModel):
+    items: List[ProductResponse]
+    next_cursor: Optional[int] = None
 
 # API (4)
 class ProductSearchResponse(BaseModel):
     product_id: int
     product_name: str
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# API (6)
+class FamilyResponse(BaseModel):
+    family_id: int
+    family_name: Optional[str] = None
+    category: Optional[int] = None
+    image: Optional[str] = None
+    products: Optional[List[ProductResponse]] = None  # Only set when include_products=true
+
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,18 +1,31 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Async driver URL (defaults to the aiomysql equivalent of DATABASE_URL)
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://")
+)
 
-# Engine for MySQL connection
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# Async engine for MySQL connection (pool sized for bursty concurrent requests)
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600
+)
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session factory (no expiry on commit so serialization doesn't trigger reloads).
+# Read endpoints run their queries inside `async with db.begin()` so the connection
+# goes back to the pool before the response is serialized.
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
\ No newline at end of file
@@ -1,114 +1,223 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends, HTTPException, status, Query, Path, Request
+from fastapi import FastAPI, Depends, HTTPException, status, Query, Path, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import cast, Integer, or_, and_, exists, func, select
+from sqlalchemy import cast, Integer, or_, and_, exists, func, select, union, union_all, literal, event, lambda_stmt
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.orm import Session
-from Models.models import Category, Family, Product, ProductWattage, Base
+from sqlalchemy.ext.asyncio import AsyncSession
+from Models.models import Category, Family, Product, ProductWattage, ProductColorTemp, Base
 import database
 from database import engine, SessionLocal
 from typing import List, AsyncIterator
-from ResponseModels.responses import CategoryWithCountResponse
+from ResponseModels.responses import CategoryWithCountResponse, ProductResponse, ProductPageResponse, FamilyResponse
+from cachetools import TTLCache
+from itertools import chain
+import anyio
+import hashlib
+import re
+import orjson
 import os
 
 # Lifespan manager
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Handles startup and shutdown events"""
-    # Startup: Create tables
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created")
+    # Startup: Create tables (opt-in, production boots skip the reflection round-trips)
+    if os.getenv("AUTO_CREATE_TABLES"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        print("✅ Database tables created")
     yield
     # Shutdown: Clean up resources
+    await engine.dispose()
     print("🛑 Application shutting down")
 
 app = FastAPI(
     title="Lytemaster API",
     version="1.0.0",
-    lifespan=lifespan  # Use lifespan instead of on_event
+    lifespan=lifespan,  # Use lifespan instead of on_event
+    default_response_class=ORJSONResponse
 )
 
 # Mount static files directory
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Add CORS middleware
-origins = [
-    "http://localhost",
-    "http://localhost:3000",
-    "http://127.0.0.1:3000",
-    "https://lytemaster.vercel.app",
-    "*"  
-]
+origin_regex = r"^https?://(localhost(:\d+)?|127\.0\.0\.1(:\d+)?|lytemaster\.vercel\.app)$"
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origin_regex=origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["*"], 
+    expose_headers=["ETag"],
+    max_age=86400,  # Let browsers cache preflights for a day
 )
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 # FUNCTIONS -H1
-def parse_wattage_range(wattage_str: str):
-    """Extract min and max wattage from a range string like '3W-40W'"""
-    try:
-        min_w, max_w = wattage_str.replace("W", "").split("-")
-        return int(min_w), int(max_w)
-    except (ValueError, AttributeError):
-        return None, None
+async def get_catalog_etag(db: AsyncSession, category_id: int = None) -> str:
+    """Build an ETag from the latest update time and row count of each catalog table"""
+    product_stmt = select(func.max(Product.updated_at), func.count(Product.product_id)) \
+        .select_from(Product).join(Family)
+    family_stmt = select(func.max(Family.updated_at), func.count(Family.family_id))
+    category_stmt = select(func.max(Category.updated_at), func.count(Category.category_id))
+    if category_id is not None:
+        product_stmt = product_stmt.where(Family.category == category_id)
+        family_stmt = family_stmt.where(Family.category == category_id)
+        category_stmt = category_stmt.where(Category.category_id == category_id)
+    versions = (await db.execute(union_all(product_stmt, family_stmt, category_stmt))).all()
+    return '"' + hashlib.sha1(repr(versions).encode()).hexdigest() + '"'
 
-def parse_color_temp(color_temp_str: str):
-    """Extract individual color temperatures from a string like '4000K,5000K,6000K'"""
-    try:
-        return [int(temp.replace("K", "")) for temp in color_temp_str.split(",")]
-    except (ValueError, AttributeError):
-        return []
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match check per RFC 9110: comma-separated list, weak comparison (W/ ignored) and '*'"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+async def stream_json_array(first_rows, partitions):
+    """Stream an already fetched first batch plus the remaining cursor batches as a JSON array"""
+    yield b"[" + b",".join(orjson.dumps(dict(row)) for row in first_rows)
+    separator = b"," if first_rows else b""
+    async for rows in partitions:
+        yield separator + b",".join(orjson.dumps(dict(row)) for row in rows)
+        separator = b","
+    yield b"]"
+
+class SessionStreamingResponse(StreamingResponse):
+    """StreamingResponse that closes the session it streams from however sending ends (done, error or disconnect)"""
+    def __init__(self, content, db: AsyncSession, **kwargs):
+        super().__init__(content, **kwargs)
+        self.db = db
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Shielded: a client disconnect cancels the send and would otherwise cancel the close too
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()
+                await self.db.close()
+
+# Characters with special meaning in FULLTEXT BOOLEAN MODE, stripped from user input
+FULLTEXT_OPERATORS_RE = re.compile(r'[+\-<>()~*"@]+')
+# InnoDB defaults (innodb_ft_min_token_size / INNODB_FT_DEFAULT_STOPWORD): such words are never indexed
+FULLTEXT_MIN_TOKEN_SIZE = 3
+FULLTEXT_STOPWORDS = frozenset((
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for", "from", "how", "i",
+    "in", "is", "it", "la", "of", "on", "or", "that", "the", "this", "to", "was", "what", "when",
+    "where", "who", "will", "with", "und", "www"
+))
+
+def fulltext_prefix_terms(query: str):
+    """Turn a search bar query into required BOOLEAN MODE prefix terms ('led dow' -> '+led* +dow*'),
+    or None when a word cannot be served by the FULLTEXT index (too short, a stopword or split on punctuation)"""
+    words = FULLTEXT_OPERATORS_RE.sub(" ", query).split()
+    if not words or any(
+        len(word) < FULLTEXT_MIN_TOKEN_SIZE or word.lower() in FULLTEXT_STOPWORDS or not word.isalnum()
+        for word in words
+    ):
+        return None
+    return " ".join(f"+{word}*" for word in words)
+
+def keyset_page(rows, limit: int) -> dict:
+    """Wrap a page of product rows with the cursor for the next page (None on the last page)"""
+    return {
+        "items": rows,
+        "next_cursor": rows[-1]["product_id"] if rows and len(rows) == limit else None
+    }
+
+# Image URL prefix fixed from the environment when the deployment URL is known
+# (e.g. STATIC_BASE_URL=https://api.example.com/static/), resolved once at import
+STATIC_BASE_URL = os.getenv("STATIC_BASE_URL")
+IMAGE_BASE_URL = STATIC_BASE_URL.rstrip("/") + "/product_images/" if STATIC_BASE_URL else None
+
+def get_image_base_url(request: Request) -> str:
+    """Product image URL prefix, falling back to the current request's base URL"""
+    if IMAGE_BASE_URL:
+        return IMAGE_BASE_URL
+    return f"{request.base_url}static/product_images/"
+
+# In-process cache of the /categories response as (etag, categories); membership changes rarely
+categories_cache = TTLCache(maxsize=1, ttl=60)
+
+@event.listens_for(Session, "after_flush")
+def clear_categories_cache(session, flush_context):
+    """Drop the cached /categories response when catalog rows are written through the ORM"""
+    if any(isinstance(obj, (Category, Family, Product)) for obj in chain(session.new, session.dirty, session.deleted)):
+        categories_cache.clear()
+
+# Plain columns for the read-only product list endpoints (rows skip ORM identity map / instrumentation).
+# Taken from ProductResponse so the streamed endpoint, which bypasses response validation, emits the documented fields
+product_columns = [Product.__table__.c[name] for name in ProductResponse.model_fields]
+
+def select_fulltext_matches(terms: str):
+    """Products whose own, family or category name matches the FULLTEXT terms, joined from a derived table"""
+    matches = union(
+        select(Product.product_id)
+        .where(match(Product.product_name, against=terms).in_boolean_mode()),
+        select(Product.product_id).join(Family)
+        .where(match(Family.family_name, against=terms).in_boolean_mode()),
+        select(Product.product_id).join(Family).join(Category)
+        .where(match(Category.category_name, against=terms).in_boolean_mode())
+    ).subquery()
+    return select(*product_columns).join(matches, matches.c.product_id == Product.product_id)
+
+def select_products_with_image_url(base_url: str):
+    """SELECT of the product columns with product_image built into a full URL (NULL / empty images become NULL)"""
+    return select(
+        *(column for column in product_columns if column.key != "product_image"),
+        (literal(base_url) + func.nullif(Product.product_image, "")).label("product_image")
+    )
 
 # API ENDPOINTS -H1
 
 # (1) GET categories along with their id, name, and the number of products in them
 @app.get("/categories", response_model=List[CategoryWithCountResponse])
-def get_categories_with_product_counts(db: Session = Depends(get_db)):
-    stmt = (
-        select(
-            Category.category_id,
-            Category.category_name,
-            func.count(Product.product_id).label("product_count")
-        )
-        .outerjoin(Family, Category.families)
-        .outerjoin(Product, Family.products)
-        .group_by(Category.category_id, Category.category_name)
-    )
-    result = db.execute(stmt).all()
-    return [
-        {
-            "category_id": category_id,
-            "category_name": category_name,
-            "product_count": product_count
-        }
-        for category_id, category_name, product_count in result
-    ]
+async def get_categories_with_product_counts(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    cached = categories_cache.get("categories")
+    if cached is None:
+        stmt = select(Category.category_id, Category.category_name, Category.product_count)
+        async with db.begin():
+            etag = await get_catalog_etag(db)
+            result = (await db.execute(stmt)).all()
+        categories = [
+            {
+                "category_id": category_id,
+                "category_name": category_name,
+                "product_count": product_count
+            }
+            for category_id, category_name, product_count in result
+        ]
+        cached = categories_cache["categories"] = (etag, categories)
+
+    etag, categories = cached
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return categories
 
 # (2) GET number of products by category (cta_button)
 @app.get("/home/products/products_button/{category_id}")
 async def get_product_counts_by_category(
     category_id: int = Path(..., description="ID of the category to count products for"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        product_count = db.query(
-            func.count(Product.product_id).label("product_count")
-        ).join(Family, Family.family_id == Product.product_family) \
-         .filter(Family.category == category_id) \
-         .scalar()
+        stmt = select(Category.product_count).where(Category.category_id == category_id)
+        async with db.begin():
+            product_count = (await db.execute(stmt)).scalar_one_or_none()
         if product_count is None:
             return 0
         return product_count
@@ -119,83 +228,110 @@ async def get_product_counts_by_category(
         )
 
 # (3) GET products by category
-@app.get("/categories/{category_id}/products")
-async def get_category_products(category_id: int, request: Request, db: Session = Depends(get_db)):
-    base_url = str(request.base_url) + "static/product_images/"
-
-    category_products = (
-        db.query(Product)
+@app.get(
+    "/categories/{category_id}/products",
+    response_model=None,
+    responses={200: {"model": List[ProductResponse]}, 304: {"description": "Not Modified"}}
+)
+async def get_category_products(category_id: int, request: Request):
+    # Image URL is built in the SELECT list; rows are fetched and encoded 500 at a time
+    base_url = get_image_base_url(request)
+    stmt = (
+        select_products_with_image_url(base_url)
         .join(Family)
-        .filter(Family.category == category_id)
-        .all()
+        .where(Family.category == category_id)
+        .execution_options(yield_per=500)
+    )
+    # The endpoint owns its session (get_db's is closed before a streaming body is sent), so the ETag and
+    # the rows are read in one transaction / snapshot. Trade-off: unlike the other read endpoints, the pooled
+    # connection stays checked out until the last batch has been sent to the client.
+    db = SessionLocal()
+    try:
+        etag = await get_catalog_etag(db, category_id)
+        if etag_matches(request, etag):
+            await db.close()
+            return Response(status_code=304, headers={"ETag": etag})
+        # Fetch the first batch up front so connection / query errors still surface as a 500
+        partitions = (await db.stream(stmt)).mappings().partitions()
+        first_rows = await anext(partitions, [])
+    except Exception as e:
+        await db.close()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch products: {str(e)}"
+        )
+    return SessionStreamingResponse(
+        stream_json_array(first_rows, partitions),
+        db,
+        media_type="application/json",
+        headers={"ETag": etag}
     )
-
-    for product in category_products:
-        if product.product_image:  
-            product.product_image = base_url + product.product_image
-
-    return category_products
 
 # (4) GET search products using filters (LVL 1 Search)
-@app.get("/products/searchbar/products_search")
+@app.get("/products/searchbar/products_search", response_model=ProductPageResponse)
 async def search_products(
     query: str = Query(..., description="Search term for product name, category, or family"),
-    skip: int = Query(0, description="Number of items to skip"),
+    after_id: int = Query(None, description="Cursor: return products after this product_id (next_cursor of the previous page)"),
     limit: int = Query(10, description="Maximum number of items to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    search_query_db = db.query(Product).join(Family).join(Category).filter(
-        or_(
-            Product.product_name.ilike(f"%{query}%"),
-            Family.family_name.ilike(f"%{query}%"),
-            Category.category_name.ilike(f"%{query}%")
-        )
-    ).offset(skip).limit(limit)
-    return search_query_db.all()
+    # FULLTEXT prefix search (one UNION branch per table index), paged by product_id cursor
+    # Words the index cannot serve fall back to a substring ILIKE scan
+    terms = fulltext_prefix_terms(query)
+    if terms is not None:
+        stmt = lambda_stmt(lambda: select_fulltext_matches(terms))
+    else:
+        pattern = f"%{query}%"
+        stmt = lambda_stmt(lambda: select(*product_columns).join(Family).join(Category).where(
+            or_(
+                Product.product_name.ilike(pattern),
+                Family.family_name.ilike(pattern),
+                Category.category_name.ilike(pattern)
+            )
+        ))
+    if after_id is not None:
+        stmt += lambda s: s.where(Product.product_id > after_id)
+    stmt += lambda s: s.order_by(Product.product_id).limit(limit)
+    async with db.begin():
+        rows = (await db.execute(stmt)).mappings().all()
+    return keyset_page(rows, limit)
 
 # (5) Detailed Object Level Filter
-@app.get("/products/product_details/filter")
+@app.get("/products/product_details/filter", response_model=List[ProductResponse])
 async def filtering_products(
     search_query: str = Query(None, description="Search term for product name or description"),
     category: str = Query(None, description="Filter by category"),
     min_wattage: int = Query(None, description="Minimum wattage"),
     color_temp: int = Query(None, description="Filter by color temperature in Kelvin"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        search_query_db = db.query(Product)
+        # Patterns are built outside the lambdas so they are tracked as bound parameters
+        search_query_db = lambda_stmt(lambda: select(Product))
         if search_query:
-            search_query_db = search_query_db.filter(
-                Product.product_name.ilike(f"%{search_query}%")
+            name_pattern = f"%{search_query}%"
+            search_query_db += lambda s: s.where(
+                Product.product_name.ilike(name_pattern)
             )
         if category:
-            search_query_db = search_query_db.join(Family).join(Category).filter(
-                Category.category_name.ilike(f"%{category}%")
+            category_pattern = f"%{category}%"
+            search_query_db += lambda s: s.join(Family).join(Category).where(
+                Category.category_name.ilike(category_pattern)
             )
         if min_wattage:
-            search_query_db = search_query_db.filter(
-                or_(
-                    *[
-                        and_(
-                            parse_wattage_range(Product.product_wattage)[0] <= min_wattage,
-                            parse_wattage_range(Product.product_wattage)[1] >= min_wattage
-                        )
-                        for product in search_query_db
-                        if parse_wattage_range(Product.product_wattage) != (None, None)
-                    ]
-                )
+            search_query_db += lambda s: s.where(
+                Product.product_wattage_min <= min_wattage,
+                Product.product_wattage_max >= min_wattage
             )
         if color_temp:
-            search_query_db = search_query_db.filter(
-                or_(
-                    *[
-                        color_temp in parse_color_temp(Product.product_color_temp)
-                        for product in search_query_db
-                        if parse_color_temp(Product.product_color_temp)
-                    ]
+            search_query_db += lambda s: s.where(
+                exists().where(
+                    ProductColorTemp.product_id == Product.product_id,
+                    ProductColorTemp.kelvin == color_temp
                 )
             )
-        results = search_query_db.all()
+        async with db.begin():
+            results = (await db.execute(search_query_db)).scalars().all()
         return results
     except Exception as e:
         raise HTTPException(
@@ -204,44 +340,62 @@ async def filtering_products(
         )
 
 # (6) GET Products Category specific family list (LVL 2 Search and Filter)
-@app.get("/products/category/{category_id}/families")
+@app.get("/products/category/{category_id}/families", response_model=List[FamilyResponse], response_model_exclude_unset=True)
 async def get_filtered_families_by_category(
     request: Request,
     category_id: int = Path(..., description="ID of the category to fetch families for"),
     mounting_type: str = Query(None, description="Filter by mounting type (e.g., Ceiling recessed)"),
     light_distribution: str = Query(None, description="Filter by light distribution (e.g., A10-A32 wide 100% direct)"),
     lamp_type: str = Query(None, description="Filter by lamp type (e.g., LED)"),
-    db: Session = Depends(get_db)
+    include_products: bool = Query(False, description="Also return each family's matching products"),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get families belonging to a specific category, where at least one product matches the filters"""
     try:
-        family_query = db.query(Family).filter(
+        # Image URL is built in the SELECT list
+        base_url = get_image_base_url(request)
+        family_query = select(
+            Family.family_id,
+            Family.family_name,
+            Family.category,
+            (literal(base_url) + func.nullif(Family.image, "")).label("image")
+        ).where(
             Family.category == category_id
         )
-        if mounting_type or light_distribution or lamp_type:
-            family_query = family_query.filter(
+        # Only splat the filters that were given (no constant TRUE terms in the subquery)
+        product_conditions = []
+        if mounting_type:
+            product_conditions.append(Product.product_mounting.ilike(f"%{mounting_type}%"))
+        if light_distribution:
+            product_conditions.append(Product.product_light_distribution.ilike(f"%{light_distribution}%"))
+        if lamp_type:
+            product_conditions.append(Product.product_lamp_type.ilike(f"%{lamp_type}%"))
+        if product_conditions:
+            family_query = family_query.where(
                 exists().where(
-                    and_(
-                        Product.product_family == Family.family_id,
-                        *(  
-                            (Product.product_mounting.ilike(f"%{mounting_type}%")) if mounting_type else True,
-                            (Product.product_light_distribution.ilike(f"%{light_distribution}%")) if light_distribution else True,
-                            (Product.product_lamp_type.ilike(f"%{lamp_type}%")) if lamp_type else True,
-                        )
-                    )
+                    and_(Product.product_family == Family.family_id, *product_conditions)
                 )
             )
-        families = family_query.all()
+        async with db.begin():
+            families = (await db.execute(family_query)).mappings().all()
+            if families and include_products:
+                # One IN-list query for all products (selectin style) instead of a row-multiplying join
+                product_query = select_products_with_image_url(base_url).where(
+                    Product.product_family.in_([family["family_id"] for family in families]),
+                    *product_conditions
+                ).order_by(Product.product_id)
+                family_products = {family["family_id"]: [] for family in families}
+                for product in (await db.execute(product_query)).mappings():
+                    family_products[product["product_family"]].append(product)
+                families = [
+                    {**family, "products": family_products[family["family_id"]]}
+                    for family in families
+                ]
         if not families:
             raise HTTPException(
                 status_code=404,
                 detail=f"No families found for category ID {category_id} with the specified filters"
             )
-        # Use the current request's base URL to build the image URL dynamically
-        base_url = str(request.base_url) + "static/product_images/"
-        for family in families:
-            if family.image:
-                family.image = base_url + family.image
         return families
     except Exception as e:
         raise HTTPException(
@@ -250,7 +404,7 @@ async def get_filtered_families_by_category(
         )
 
 # (7) GET Filter products within a specific category and specific family and other filters (LVL 3 Search and Filter)
-@app.get("/products/category/{category_id}/{family_id}/filter")
+@app.get("/products/category/{category_id}/{family_id}/filter", response_model=ProductPageResponse)
 async def filter_products_in_category(
     category_id: int = Path(..., description="ID of the category to filter products in"),
     family_id: int = Path(..., description="ID of the family to filter products in"),
@@ -258,33 +412,42 @@ async def filter_products_in_category(
     light_distribution: str = Query(None, description="Filter by light distribution (e.g., A10-A32 wide 100% direct)"),
     ip_rating: str = Query(None, description="Filter by IP ratings (e.g., IP20)"),
     lamp_type: str = Query(None, description="Filter by lamp type (e.g., LED)"),
-    skip: int = Query(0, description="Number of items to skip"),
+    after_id: int = Query(None, description="Cursor: return products after this product_id (next_cursor of the previous page)"),
     limit: int = Query(10, description="Maximum number of items to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        filter_query = db.query(Product).join(Family).filter(
+        # Patterns are built outside the lambdas so they are tracked as bound parameters
+        filter_query = lambda_stmt(lambda: select(*product_columns).join(Family).where(
             Family.category == category_id,
             Product.product_family == family_id
-        )
+        ))
         if mounting_type:
-            filter_query = filter_query.filter(
-                Product.product_mounting.ilike(f"%{mounting_type}%")
+            mounting_pattern = f"%{mounting_type}%"
+            filter_query += lambda s: s.where(
+                Product.product_mounting.ilike(mounting_pattern)
             )
         if light_distribution:
-            filter_query = filter_query.filter(
-                Product.product_light_distribution.ilike(f"%{light_distribution}%")
+            light_distribution_pattern = f"%{light_distribution}%"
+            filter_query += lambda s: s.where(
+                Product.product_light_distribution.ilike(light_distribution_pattern)
             )
         if lamp_type:
-            filter_query = filter_query.filter(
-                Product.product_lamp_type.ilike(f"%{lamp_type}%")
+            lamp_type_pattern = f"%{lamp_type}%"
+            filter_query += lambda s: s.where(
+                Product.product_lamp_type.ilike(lamp_type_pattern)
             )
         if ip_rating:
-            filter_query = filter_query.filter(
-                Product.product_ip_rating.ilike(f"%{ip_rating}%")
+            ip_rating_pattern = f"%{ip_rating}%"
+            filter_query += lambda s: s.where(
+                Product.product_ip_rating.ilike(ip_rating_pattern)
             )
-        results = filter_query.offset(skip).limit(limit).all()
-        return results
+        if after_id is not None:
+            filter_query += lambda s: s.where(Product.product_id > after_id)
+        filter_query += lambda s: s.order_by(Product.product_id).limit(limit)
+        async with db.begin():
+            results = (await db.execute(filter_query)).mappings().all()
+        return keyset_page(results, limit)
     except Exception as e:
         raise HTTPException(
             status_code=500,
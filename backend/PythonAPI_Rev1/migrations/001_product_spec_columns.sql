@@ -0,0 +1,15 @@
+-- Numeric wattage range and normalized color temperatures for the product filter endpoint (5)
+-- Run BackfillProductSpecs.py afterwards to populate them from the existing string columns
+
+ALTER TABLE products
+    ADD COLUMN product_wattage_min INT NULL,
+    ADD COLUMN product_wattage_max INT NULL,
+    ADD INDEX ix_products_wattage_range (product_wattage_min, product_wattage_max);
+
+CREATE TABLE product_color_temps (
+    product_id INT NOT NULL,
+    kelvin INT NOT NULL,
+    PRIMARY KEY (product_id, kelvin),
+    INDEX ix_product_color_temps_kelvin (kelvin, product_id),
+    CONSTRAINT fk_product_color_temps_product FOREIGN KEY (product_id) REFERENCES products (product_id)
+);
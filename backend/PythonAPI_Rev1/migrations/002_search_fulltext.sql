@@ -0,0 +1,5 @@
+-- FULLTEXT indexes backing the product search bar endpoint (4)
+
+ALTER TABLE products ADD FULLTEXT INDEX ix_products_name_fulltext (product_name);
+ALTER TABLE family ADD FULLTEXT INDEX ix_family_name_fulltext (family_name);
+ALTER TABLE category ADD FULLTEXT INDEX ix_category_name_fulltext (category_name);
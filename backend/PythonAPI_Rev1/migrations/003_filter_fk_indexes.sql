@@ -0,0 +1,6 @@
+-- Btree indexes on the foreign keys every category / family filter and count joins through
+-- InnoDB creates an index for a declared FOREIGN KEY on its own; check SHOW INDEX first and
+-- skip a statement if an index leading with that column already exists
+
+CREATE INDEX ix_products_product_family ON products (product_family);
+CREATE INDEX ix_family_category ON family (category);
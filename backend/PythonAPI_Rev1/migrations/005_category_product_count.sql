@@ -0,0 +1,66 @@
+-- Precomputed product count per category, read by /categories and the products button count
+-- Kept in sync by triggers on products and family so reads never need the join + GROUP BY
+
+ALTER TABLE category ADD COLUMN product_count INT NOT NULL DEFAULT 0;
+
+UPDATE category c
+SET c.product_count = (
+    SELECT COUNT(p.product_id)
+    FROM family f
+    JOIN products p ON p.product_family = f.family_id
+    WHERE f.category = c.category_id
+);
+
+DELIMITER //
+
+CREATE TRIGGER products_count_after_insert AFTER INSERT ON products
+FOR EACH ROW
+BEGIN
+    UPDATE category c JOIN family f ON f.category = c.category_id
+    SET c.product_count = c.product_count + 1
+    WHERE f.family_id = NEW.product_family;
+END//
+
+CREATE TRIGGER products_count_after_delete AFTER DELETE ON products
+FOR EACH ROW
+BEGIN
+    UPDATE category c JOIN family f ON f.category = c.category_id
+    SET c.product_count = c.product_count - 1
+    WHERE f.family_id = OLD.product_family;
+END//
+
+CREATE TRIGGER products_count_after_update AFTER UPDATE ON products
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.product_family <=> OLD.product_family) THEN
+        UPDATE category c JOIN family f ON f.category = c.category_id
+        SET c.product_count = c.product_count - 1
+        WHERE f.family_id = OLD.product_family;
+        UPDATE category c JOIN family f ON f.category = c.category_id
+        SET c.product_count = c.product_count + 1
+        WHERE f.family_id = NEW.product_family;
+    END IF;
+END//
+
+CREATE TRIGGER family_count_after_update AFTER UPDATE ON family
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.category <=> OLD.category) THEN
+        UPDATE category
+        SET product_count = product_count - (SELECT COUNT(*) FROM products WHERE product_family = OLD.family_id)
+        WHERE category_id = OLD.category;
+        UPDATE category
+        SET product_count = product_count + (SELECT COUNT(*) FROM products WHERE product_family = NEW.family_id)
+        WHERE category_id = NEW.category;
+    END IF;
+END//
+
+CREATE TRIGGER family_count_after_delete AFTER DELETE ON family
+FOR EACH ROW
+BEGIN
+    UPDATE category
+    SET product_count = product_count - (SELECT COUNT(*) FROM products WHERE product_family = OLD.family_id)
+    WHERE category_id = OLD.category;
+END//
+
+DELIMITER ;
@@ -0,0 +1,76 @@
+-- Keep the product filter columns from 001 in sync with product_wattage / product_color_temp on every write
+-- Parsing mirrors BackfillProductSpecs.py, which is still needed once for rows written before this migration
+-- Requires MySQL 8.0 (REGEXP_SUBSTR)
+
+DELIMITER //
+
+CREATE PROCEDURE sync_product_color_temps(IN p_product_id INT, IN p_color_temp VARCHAR(100))
+BEGIN
+    DECLARE temps VARCHAR(100) DEFAULT REPLACE(REPLACE(REPLACE(COALESCE(p_color_temp, ''), 'K', ''), 'k', ''), ' ', '');
+    DECLARE item VARCHAR(100);
+    DECLARE low INT;
+    DECLARE high INT;
+    DELETE FROM product_color_temps WHERE product_id = p_product_id;
+    -- A string with any unparseable entry gives no rows, tunable ranges ('2700-6500') are stored in 100K steps
+    IF temps REGEXP '^([0-9]+(-[0-9]+)?)?(,([0-9]+(-[0-9]+)?)?)*$' THEN
+        WHILE temps <> '' DO
+            SET item = SUBSTRING_INDEX(temps, ',', 1);
+            SET temps = SUBSTRING(temps, CHAR_LENGTH(item) + 2);
+            IF item <> '' THEN
+                SET low = CAST(SUBSTRING_INDEX(item, '-', 1) AS UNSIGNED);
+                SET high = CAST(SUBSTRING_INDEX(item, '-', -1) AS UNSIGNED);
+                WHILE low < high DO
+                    INSERT IGNORE INTO product_color_temps (product_id, kelvin) VALUES (p_product_id, low);
+                    SET low = low + 100;
+                END WHILE;
+                INSERT IGNORE INTO product_color_temps (product_id, kelvin) VALUES (p_product_id, high);
+            END IF;
+        END WHILE;
+    END IF;
+END//
+
+CREATE TRIGGER products_wattage_before_insert BEFORE INSERT ON products
+FOR EACH ROW
+BEGIN
+    IF NEW.product_wattage REGEXP '^[[:space:]]*[0-9]+[[:space:]]*[Ww]?[[:space:]]*(-[[:space:]]*[0-9]+[[:space:]]*[Ww]?[[:space:]]*)?$' THEN
+        SET NEW.product_wattage_min = CAST(REGEXP_SUBSTR(NEW.product_wattage, '[0-9]+', 1, 1) AS UNSIGNED);
+        SET NEW.product_wattage_max = CAST(COALESCE(REGEXP_SUBSTR(NEW.product_wattage, '[0-9]+', 1, 2), NEW.product_wattage_min) AS UNSIGNED);
+    ELSE
+        SET NEW.product_wattage_min = NULL, NEW.product_wattage_max = NULL;
+    END IF;
+END//
+
+CREATE TRIGGER products_wattage_before_update BEFORE UPDATE ON products
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.product_wattage <=> OLD.product_wattage) THEN
+        IF NEW.product_wattage REGEXP '^[[:space:]]*[0-9]+[[:space:]]*[Ww]?[[:space:]]*(-[[:space:]]*[0-9]+[[:space:]]*[Ww]?[[:space:]]*)?$' THEN
+            SET NEW.product_wattage_min = CAST(REGEXP_SUBSTR(NEW.product_wattage, '[0-9]+', 1, 1) AS UNSIGNED);
+            SET NEW.product_wattage_max = CAST(COALESCE(REGEXP_SUBSTR(NEW.product_wattage, '[0-9]+', 1, 2), NEW.product_wattage_min) AS UNSIGNED);
+        ELSE
+            SET NEW.product_wattage_min = NULL, NEW.product_wattage_max = NULL;
+        END IF;
+    END IF;
+END//
+
+CREATE TRIGGER products_color_temps_after_insert AFTER INSERT ON products
+FOR EACH ROW
+BEGIN
+    CALL sync_product_color_temps(NEW.product_id, NEW.product_color_temp);
+END//
+
+CREATE TRIGGER products_color_temps_after_update AFTER UPDATE ON products
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.product_color_temp <=> OLD.product_color_temp) THEN
+        CALL sync_product_color_temps(NEW.product_id, NEW.product_color_temp);
+    END IF;
+END//
+
+CREATE TRIGGER products_color_temps_before_delete BEFORE DELETE ON products
+FOR EACH ROW
+BEGIN
+    DELETE FROM product_color_temps WHERE product_id = OLD.product_id;
+END//
+
+DELIMITER ;